@@ -0,0 +1,125 @@
+"""
+Pytest hooks for content-based skipping of the JS/UFE comparison classes.
+
+TestJSCliBasic and TestJSPythonParsing spawn npx/tsx and UFE even when a
+change only touched Python code. Their inputs (cli.ts, the parser
+sources under web/src, UFE.exe, and the test module itself) are hashed
+after every green run; while the hash is
+unchanged the two classes are skipped. Pass --force-cross-platform to
+run them regardless. Plain unittest discovery never imports this file,
+so the fallback runner is unaffected.
+"""
+
+import hashlib
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+TESTS_DIR = Path(__file__).parent
+WEB_DIR = TESTS_DIR.parent / "web"
+_HASHED_INPUTS = (
+    WEB_DIR / "cli.ts",
+    TESTS_DIR.parent / "UFE" / "UFE.exe",
+    TESTS_DIR / "test_cross_platform.py",
+)
+
+
+def _hashed_inputs():
+    """All files whose content feeds the skip-gate hash.
+
+    cli.ts is a thin wrapper around the parser modules in web/src, so
+    those are inputs too - the same set _newest_cli_source_mtime() uses
+    when deciding whether to rebundle.
+    """
+    return _HASHED_INPUTS + tuple(sorted(WEB_DIR.glob("src/**/*.ts")))
+_CACHE_KEY = "cross_platform/hash"
+_SKIPPED_CLASSES = ("TestJSCliBasic", "TestJSPythonParsing")
+
+
+@pytest.fixture(scope="session")
+def level_9_unpacked():
+    """Unpacked level 9 save bytes, shared for the whole session."""
+    from tests.fixture_cache import LEVEL_9_SAVE, load_unpacked
+    return load_unpacked(str(LEVEL_9_SAVE))
+
+
+@pytest.fixture(scope="session")
+def level_10_unpacked():
+    """Unpacked level 10 save bytes, shared for the whole session."""
+    from tests.fixture_cache import LEVEL_10_SAVE, load_unpacked
+    return load_unpacked(str(LEVEL_10_SAVE))
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_js_toolchain():
+    """Pay the Node/npx cold start up front instead of in the first JS test.
+
+    The first npx tsx invocation of a session is several seconds slower
+    than the rest (package resolution, transpile cache priming); warming
+    it here keeps individual test timings representative. Errors are
+    ignored - suites without a Node toolchain simply skip the warmup.
+    """
+    npx = shutil.which("npx")
+    if npx is not None:
+        try:
+            subprocess.run(
+                [npx, "tsx", "--version"],
+                cwd=TESTS_DIR.parent / "web",
+                capture_output=True,
+                timeout=30,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            pass
+    yield
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--force-cross-platform",
+        action="store_true",
+        default=False,
+        help="Run the JS/UFE comparison classes even if their inputs are "
+             "unchanged since the last green run",
+    )
+
+
+def _inputs_hash() -> str:
+    digest = hashlib.sha1()
+    for path in _hashed_inputs():
+        digest.update(path.name.encode())
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            digest.update(b"<missing>")
+    return digest.hexdigest()
+
+
+def pytest_collection_modifyitems(config, items):
+    config._cross_platform_exercised = False
+    js_items = [
+        item for item in items
+        if getattr(item, "cls", None) is not None
+        and item.cls.__name__ in _SKIPPED_CLASSES
+    ]
+    if not js_items:
+        return
+
+    if (not config.getoption("--force-cross-platform")
+            and config.cache.get(_CACHE_KEY, None) == _inputs_hash()):
+        marker = pytest.mark.skip(
+            reason="JS sources and UFE unchanged since last green run"
+        )
+        for item in js_items:
+            item.add_marker(marker)
+    else:
+        config._cross_platform_exercised = True
+
+
+def pytest_sessionfinish(session, exitstatus):
+    config = session.config
+    # Only a green run that actually exercised the comparison classes may
+    # refresh the hash; a green python-only run must not mask JS changes.
+    if exitstatus == 0 and getattr(config, "_cross_platform_exercised", False):
+        config.cache.set(_CACHE_KEY, _inputs_hash())
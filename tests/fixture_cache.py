@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Shared fixture loaders for the test suite.
+
+Both test modules (and the pytest session fixtures in conftest.py) pull
+unpacked fixture bytes from here, so a run that touches several test
+files still decompresses each save at most once per process.
+"""
+
+import functools
+from pathlib import Path
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from use import rawscan
+
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
+LEVEL_9_SAVE = FIXTURES_DIR / "see_me_now" / "level_9" / "global.dat"
+LEVEL_10_SAVE = FIXTURES_DIR / "see_me_now" / "level_10" / "global.dat"
+LEVEL_11_SAVE = FIXTURES_DIR / "see_me_now" / "level_11" / "global.dat"
+GRANITE_SAVE = FIXTURES_DIR / "granite" / "level_1" / "global.dat"
+
+
+@functools.lru_cache(maxsize=None)
+def load_packed(path_str: str) -> bytes:
+    """Read a packed fixture file once per run."""
+    return Path(path_str).read_bytes()
+
+
+@functools.lru_cache(maxsize=None)
+def load_unpacked(path_str: str) -> bytes:
+    """Read and unpack a packed fixture once per run.
+
+    Decompression is the expensive step on the raw path; the result is
+    immutable bytes, so sharing the cached object across classes and
+    modules is safe.
+    """
+    return rawscan.unpack_data(load_packed(path_str))
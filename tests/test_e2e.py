@@ -7,8 +7,15 @@ Tests validate:
 - Skill data is correctly parsed from actual game saves
 - Character info, attributes, and equipment are parsed correctly
 - 40 skill points difference between level 9 and level 10
+
+Set UFE_FAST_TESTS=1 to skip the slowest classes (the compression
+round-trips and the progression totals) for quick local loops; CI runs
+the full module.
 """
 
+import hashlib
+import itertools
+import os
 import unittest
 import sys
 from pathlib import Path
@@ -19,6 +26,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 from use.core import (
     load_save_data,
     get_skill_entries,
+    get_skill_index,
     get_skill_names,
     find_character_name,
     find_character_level,
@@ -31,6 +39,8 @@ from use.core import (
     clear_cache,
 )
 from use.ufe_parser import SaveData
+from use import rawscan
+from tests.fixture_cache import load_packed, load_unpacked
 
 
 # Fixture paths
@@ -40,27 +50,45 @@ LEVEL_10_SAVE = FIXTURES_DIR / "see_me_now" / "level_10" / "global.dat"
 LEVEL_11_SAVE = FIXTURES_DIR / "see_me_now" / "level_11" / "global.dat"
 GRANITE_SAVE = FIXTURES_DIR / "granite" / "level_1" / "global.dat"
 
+# 23 base-game skills, 24 with the Expedition DLC
+_VALID_SKILL_COUNTS = frozenset((23, 24))
+
+# Developer fast mode: skip the classes that pay extra compression
+# cycles. See the module docstring.
+_FAST = os.environ.get('UFE_FAST_TESTS') == '1'
+
+
+# Unpack the raw fixtures once at import; every class (and each forked
+# xdist worker) then shares the same immutable bytes. Guarded so missing
+# fixtures don't crash the module at import - setUpModule then skips
+# the whole module with the offending path named.
+if LEVEL_9_SAVE.exists() and LEVEL_10_SAVE.exists():
+    _L9_UNPACKED = load_unpacked(str(LEVEL_9_SAVE))
+    _L10_UNPACKED = load_unpacked(str(LEVEL_10_SAVE))
+else:
+    _L9_UNPACKED = _L10_UNPACKED = None
+
+
+def setUpModule():
+    """Check fixtures, then share parses across classes.
+
+    Missing fixture files used to surface as setUpClass errors before the
+    file-exists tests could run; skipping here names the real problem up
+    front and avoids loading anything. load_save_data() caches per
+    resolved path, so clearing once here (rather than in every
+    setUpClass) means each fixture file is exported through UFE and
+    parsed exactly once per run. The tests below treat the shared
+    SaveData instances as read-only.
+    """
+    for save in (LEVEL_9_SAVE, LEVEL_10_SAVE, LEVEL_11_SAVE, GRANITE_SAVE):
+        if not save.exists():
+            raise unittest.SkipTest(f"missing save fixture: {save}")
+    clear_cache()
+
 
 class TestSaveFileLoading(unittest.TestCase):
     """Tests for loading and parsing save files via UFE."""
-    
-    @classmethod
-    def setUpClass(cls):
-        """Clear cache before tests."""
-        clear_cache()
-    
-    def test_level_9_file_exists(self):
-        """Level 9 save file should exist."""
-        self.assertTrue(LEVEL_9_SAVE.exists())
-    
-    def test_level_10_file_exists(self):
-        """Level 10 save file should exist."""
-        self.assertTrue(LEVEL_10_SAVE.exists())
-    
-    def test_level_11_file_exists(self):
-        """Level 11 save file should exist."""
-        self.assertTrue(LEVEL_11_SAVE.exists())
-    
+
     def test_level_9_loads_successfully(self):
         """Level 9 save should load via UFE parser."""
         save_data = load_save_data(LEVEL_9_SAVE)
@@ -83,7 +111,6 @@ class TestCharacterInfo(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Load save data."""
-        clear_cache()
         cls.level_9 = load_save_data(LEVEL_9_SAVE)
         cls.level_11 = load_save_data(LEVEL_11_SAVE)
     
@@ -114,7 +141,6 @@ class TestBaseAttributes(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Load save data."""
-        clear_cache()
         cls.level_9 = load_save_data(LEVEL_9_SAVE)
     
     def test_has_7_attributes(self):
@@ -139,18 +165,24 @@ class TestBaseAttributes(unittest.TestCase):
             self.assertLessEqual(attr['effective'], 50)
 
 
+def _parsed_skills(save_path):
+    """Module-wide shared skill lists.
+
+    load_save_data caches per path and get_skill_entries caches per
+    SaveData, so every class binding these sees the same list objects
+    after a single parse. Treat them as read-only.
+    """
+    return get_skill_entries(load_save_data(save_path))
+
+
 class TestSkillParsing(unittest.TestCase):
     """Tests for parsing skills from real save files."""
-    
+
     @classmethod
     def setUpClass(cls):
-        """Load and parse save files."""
-        clear_cache()
-        cls.level_9 = load_save_data(LEVEL_9_SAVE)
-        cls.level_10 = load_save_data(LEVEL_10_SAVE)
-        
-        cls.level_9_skills = get_skill_entries(cls.level_9)
-        cls.level_10_skills = get_skill_entries(cls.level_10)
+        """Bind the shared parsed skill lists."""
+        cls.level_9_skills = _parsed_skills(LEVEL_9_SAVE)
+        cls.level_10_skills = _parsed_skills(LEVEL_10_SAVE)
     
     def test_level_9_has_skills(self):
         """Level 9 save should have skill entries."""
@@ -167,33 +199,34 @@ class TestSkillParsing(unittest.TestCase):
     def test_has_expected_skill_count(self):
         """Should have 23 (base) or 24 (DLC) skills."""
         count = len(self.level_9_skills)
-        self.assertIn(count, [23, 24], 
+        self.assertIn(count, _VALID_SKILL_COUNTS,
                       f"Expected 23 or 24 skills, got {count}")
     
     def test_skill_values_are_reasonable(self):
         """All skill values should be within game limits."""
-        for skill in self.level_9_skills + self.level_10_skills:
-            self.assertGreaterEqual(skill['base'], 0)
-            self.assertLessEqual(skill['base'], 300)
-            self.assertGreaterEqual(skill['mod'], 0)
-            self.assertLessEqual(skill['mod'], 600)
+        out_of_range = [
+            skill
+            for skill in itertools.chain(self.level_9_skills, self.level_10_skills)
+            if not (0 <= skill['base'] <= 300 and 0 <= skill['mod'] <= 600)
+        ]
+        self.assertEqual(out_of_range, [])
 
 
+@unittest.skipIf(_FAST, "slow e2e skipped in UFE_FAST_TESTS mode")
 class TestSkillPointProgression(unittest.TestCase):
     """Tests for skill point allocation between levels."""
     
     @classmethod
     def setUpClass(cls):
-        """Load and calculate total skill points for both saves."""
-        clear_cache()
-        cls.level_9 = load_save_data(LEVEL_9_SAVE)
-        cls.level_10 = load_save_data(LEVEL_10_SAVE)
-        
-        cls.level_9_skills = get_skill_entries(cls.level_9)
-        cls.level_10_skills = get_skill_entries(cls.level_10)
-        
-        cls.level_9_total = sum(s['base'] for s in cls.level_9_skills)
-        cls.level_10_total = sum(s['base'] for s in cls.level_10_skills)
+        """Bind the shared skill lists and total their base values."""
+        cls.level_9_skills = _parsed_skills(LEVEL_9_SAVE)
+        cls.level_10_skills = _parsed_skills(LEVEL_10_SAVE)
+
+        cls.level_9_bases = [s['base'] for s in cls.level_9_skills]
+        cls.level_10_bases = [s['base'] for s in cls.level_10_skills]
+
+        cls.level_9_total = sum(cls.level_9_bases)
+        cls.level_10_total = sum(cls.level_10_bases)
         cls.point_difference = cls.level_10_total - cls.level_9_total
     
     def test_level_10_has_more_points(self):
@@ -224,32 +257,134 @@ class TestSkillDetails(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Load level 9 save and parse skills with names."""
-        clear_cache()
         cls.level_9 = load_save_data(LEVEL_9_SAVE)
         cls.skills = get_skill_entries(cls.level_9)
-        
-        # Build dict for easy lookup
-        cls.skill_dict = {skill['name']: skill for skill in cls.skills}
-    
+
+        # Cached name -> entry lookup shared with other consumers
+        cls.skill_dict = get_skill_index(cls.level_9)
+    
+    # Known (base, effective) values from the level 9 fixture
+    EXPECTED_SKILLS = (
+        ("Melee", 55, 83),
+        ("Dodge", 55, 78),
+        ("Stealth", 50, 90),
+        ("Intimidation", 0, 5),
+    )
+
     def test_melee_skill_present(self):
         """Melee skill should be present in save."""
         self.assertIn("Melee", self.skill_dict)
-    
-    def test_melee_has_expected_values(self):
-        """Melee should have expected values (base=55, effective=83)."""
-        melee = self.skill_dict.get("Melee")
-        if melee:
-            self.assertEqual(melee['base'], 55, 
-                           f"Expected Melee base=55, got {melee['base']}")
-            self.assertEqual(melee['mod'], 83,
-                           f"Expected Melee effective=83, got {melee['mod']}")
-    
-    def test_dodge_has_expected_values(self):
-        """Dodge should have expected values (base=55, effective=78)."""
-        dodge = self.skill_dict.get("Dodge")
-        if dodge:
-            self.assertEqual(dodge['base'], 55)
-            self.assertEqual(dodge['mod'], 78)
+
+    def test_known_skills_have_expected_values(self):
+        """Known skills should match their fixture values exactly.
+
+        Indexing (rather than .get() with a truthiness guard) makes a
+        missing skill a failure instead of a silent pass.
+        """
+        for name, base, mod in self.EXPECTED_SKILLS:
+            with self.subTest(skill=name):
+                skill = self.skill_dict[name]
+                self.assertEqual((skill['base'], skill['mod']), (base, mod))
+
+
+class TestRawSaveParsing(unittest.TestCase):
+    """Tests for the raw byte-scanning path against real save fixtures.
+
+    Unlike the classes above, these need neither UFE nor Node - they
+    exercise use.rawscan directly on the packed fixture files.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        """Alias the module-level pre-unpacked fixtures."""
+        if _L9_UNPACKED is None or _L10_UNPACKED is None:
+            raise unittest.SkipTest("raw save fixtures not present")
+        cls.level_9 = _L9_UNPACKED
+        cls.level_10 = _L10_UNPACKED
+
+    def test_fixtures_are_packed(self):
+        """Fixture saves should carry the packed-format GUID header."""
+        head = load_packed(str(LEVEL_9_SAVE))[:rawscan.HEADER_SIZE]
+        self.assertTrue(rawscan.is_packed(head))
+
+    def test_raw_skill_count(self):
+        """Raw scan should find all 24 DLC skills in both fixtures."""
+        self.assertEqual(len(rawscan.find_skill_entries(self.level_9)), 24)
+        self.assertEqual(len(rawscan.find_skill_entries(self.level_10)), 24)
+
+    def test_raw_skill_point_progression(self):
+        """Raw totals should show the 40 points gained at level 10."""
+        level_9_total = sum(s['base'] for s in rawscan.find_skill_entries(self.level_9))
+        level_10_total = sum(s['base'] for s in rawscan.find_skill_entries(self.level_10))
+        self.assertEqual(level_10_total - level_9_total, 40)
+
+    def test_raw_base_stats(self):
+        """Raw scan should find the 7 attributes with plausible values."""
+        for label, data in (('level_9', self.level_9),
+                            ('level_10', self.level_10)):
+            with self.subTest(save=label):
+                stats = rawscan.find_base_stats(data)
+                self.assertEqual(len(stats), 7)
+                self.assertTrue(all(3 <= s['base'] <= 10 for s in stats))
+
+    def test_raw_feats_found(self):
+        """Raw scan should detect known feats in the level 9 save."""
+        feats = rawscan.find_feats(self.level_9)
+        self.assertGreater(len(feats), 0)
+        self.assertTrue(rawscan.has_feat(self.level_9, 'nimble'))
+
+
+@unittest.skipIf(_FAST, "slow e2e skipped in UFE_FAST_TESTS mode")
+class TestRawRoundTrip(unittest.TestCase):
+    """Round-trip (unpack -> pack -> unpack) tests on real save data."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Compute each round-trip triple once for the whole class.
+
+        pack_data/unpack_data are the expensive calls here; sharing the
+        results keeps this class at two compression cycles total.
+        """
+        if _L9_UNPACKED is None or _L10_UNPACKED is None:
+            raise unittest.SkipTest("raw save fixtures not present")
+        cls.l9_unpacked = _L9_UNPACKED
+        cls.l9_repacked = rawscan.pack_data(cls.l9_unpacked)
+        cls.l9_reunpacked = rawscan.unpack_data(cls.l9_repacked)
+        cls.l10_unpacked = _L10_UNPACKED
+        cls.l10_repacked = rawscan.pack_data(cls.l10_unpacked)
+        cls.l10_reunpacked = rawscan.unpack_data(cls.l10_repacked)
+
+    def _assert_same_bytes(self, original, roundtrip):
+        """Equality via length then blake2b digest.
+
+        The length check short-circuits the common mismatch mode
+        (truncation) before any hashing, and digest comparison keeps a
+        failure report to 16 bytes instead of dumping two ~400 KB blobs.
+        """
+        self.assertEqual(len(original), len(roundtrip))
+        self.assertEqual(
+            hashlib.blake2b(original, digest_size=16).digest(),
+            hashlib.blake2b(roundtrip, digest_size=16).digest(),
+        )
+
+    def test_level_9_round_trip(self):
+        """Level 9 data should survive a pack/unpack cycle unchanged."""
+        self._assert_same_bytes(self.l9_unpacked, self.l9_reunpacked)
+
+    def test_level_10_round_trip(self):
+        """Level 10 data should survive a pack/unpack cycle unchanged."""
+        self._assert_same_bytes(self.l10_unpacked, self.l10_reunpacked)
+
+    def test_repacked_is_packed_format(self):
+        """Repacked output should carry the packed-format header."""
+        self.assertTrue(rawscan.is_packed(self.l9_repacked))
+
+    def test_skills_unchanged_after_round_trip(self):
+        """Skill entries should be identical before and after repacking."""
+        self.assertEqual(
+            rawscan.find_skill_entries(self.l9_reunpacked),
+            rawscan.find_skill_entries(self.l9_unpacked),
+        )
 
 
 class TestFeatParsing(unittest.TestCase):
@@ -258,7 +393,6 @@ class TestFeatParsing(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Load save data."""
-        clear_cache()
         cls.level_11 = load_save_data(LEVEL_11_SAVE)
     
     def test_has_feats(self):
@@ -281,7 +415,6 @@ class TestInventoryParsing(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Load save data."""
-        clear_cache()
         cls.level_11 = load_save_data(LEVEL_11_SAVE)
     
     def test_has_inventory_items(self):
@@ -314,7 +447,6 @@ class TestEquipmentParsing(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
         """Load test saves."""
-        clear_cache()
         cls.level_10 = load_save_data(LEVEL_10_SAVE)
         cls.level_11 = load_save_data(LEVEL_11_SAVE)
         cls.granite = load_save_data(GRANITE_SAVE)
@@ -5,6 +5,8 @@ Unit tests for USE (Underrail Save Editor) core functions.
 These tests verify the UFE-based parser and core functionality.
 """
 
+import struct
+import tempfile
 import unittest
 import sys
 from pathlib import Path
@@ -13,6 +15,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from use.core import (
+    is_packed,
+    pack_data,
+    unpack_data,
     get_skill_names,
     calculate_xp_needed,
     _extract_item_display_name,
@@ -22,19 +27,52 @@ from use.core import (
     FEAT_DISPLAY_NAMES,
     ITEM_CATEGORIES,
 )
+from use.rawscan import (
+    ESI_PATTERN,
+    HEADER_SIZE,
+    PACKED_HEADER,
+    find_base_stats,
+    find_feats,
+    filter_feat_strings,
+    find_character_info,
+    find_skill_entries,
+    find_strings,
+    find_xp,
+    full_analysis,
+    has_feat,
+    read_skill_values,
+    search_pattern,
+    write_packed_file,
+    write_skill_value,
+    write_stat_value,
+)
+
+
+# Shared zero padding for the synthetic buffers below. The scan
+# functions never mutate their input, so reusing the same immutable
+# bytes objects across tests is safe and avoids re-allocating fresh
+# zero-filled blocks in every method.
+_PAD10 = bytes(10)
+_PAD50 = bytes(50)
+_PAD100 = bytes(100)
+_EMPTY_1K = bytes(1000)
+
+# Compiled once; the synthetic builders pack int32 fields constantly and
+# a Struct instance skips the per-call format-string parse.
+_I32 = struct.Struct('<i')
+_II32 = struct.Struct('<ii')
 
 
 class TestSkillNameLists(unittest.TestCase):
     """Tests for skill name list functions."""
     
-    def test_base_game_has_23_skills(self):
-        """Base game should have 23 skills."""
-        self.assertEqual(len(SKILL_NAMES_BASE), 23)
-    
-    def test_dlc_has_24_skills(self):
-        """DLC version should have 24 skills."""
-        self.assertEqual(len(SKILL_NAMES_DLC), 24)
-    
+    def test_list_lengths(self):
+        """Base game should have 23 skills, DLC 24."""
+        for label, names, expected in (('base', SKILL_NAMES_BASE, 23),
+                                       ('dlc', SKILL_NAMES_DLC, 24)):
+            with self.subTest(list=label):
+                self.assertEqual(len(names), expected)
+
     def test_get_skill_names_base(self):
         """get_skill_names should return base list for < 24 skills."""
         names = get_skill_names(23)
@@ -66,69 +104,54 @@ class TestBaseStatOperations(unittest.TestCase):
     
     def test_stat_names_order(self):
         """Stat names should be in correct order."""
-        self.assertEqual(STAT_NAMES[0], 'Strength')
-        self.assertEqual(STAT_NAMES[1], 'Dexterity')
-        self.assertEqual(STAT_NAMES[2], 'Agility')
-        self.assertEqual(STAT_NAMES[6], 'Intelligence')
+        for idx, expected in ((0, 'Strength'), (1, 'Dexterity'),
+                              (2, 'Agility'), (6, 'Intelligence')):
+            with self.subTest(index=idx):
+                self.assertEqual(STAT_NAMES[idx], expected)
 
 
 class TestXPCalculation(unittest.TestCase):
     """Tests for XP-related functions."""
-    
-    # Oddity XP System tests (default)
-    def test_oddity_xp_level_1(self):
-        """Oddity: Level 1 should need 4 XP to reach level 2."""
-        self.assertEqual(calculate_xp_needed(1, 'oddity'), 4)
-    
-    def test_oddity_xp_level_10(self):
-        """Oddity: Level 10 should need 22 XP to reach level 11."""
-        self.assertEqual(calculate_xp_needed(10, 'oddity'), 22)
-    
-    def test_oddity_xp_level_11(self):
-        """Oddity: Level 11 should need 24 XP to reach level 12."""
-        self.assertEqual(calculate_xp_needed(11, 'oddity'), 24)
-    
-    def test_oddity_xp_caps_at_30(self):
-        """Oddity: XP needed caps at 30 for level 14+."""
-        self.assertEqual(calculate_xp_needed(14, 'oddity'), 30)
-        self.assertEqual(calculate_xp_needed(20, 'oddity'), 30)
-        self.assertEqual(calculate_xp_needed(25, 'oddity'), 30)
-    
+
+    # (level, system, expected XP to next level). Oddity ramps by
+    # 2*(level+1) and caps at 30 from level 14; classic is level*1000.
+    XP_TABLE = (
+        (1, 'oddity', 4),
+        (10, 'oddity', 22),
+        (11, 'oddity', 24),
+        (14, 'oddity', 30),
+        (20, 'oddity', 30),
+        (25, 'oddity', 30),
+        (1, 'classic', 1000),
+        (10, 'classic', 10000),
+        (20, 'classic', 20000),
+        (25, 'classic', 25000),
+    )
+
+    def test_xp_table(self):
+        """XP requirements should match the known values per system."""
+        for level, system, expected in self.XP_TABLE:
+            with self.subTest(level=level, system=system):
+                self.assertEqual(calculate_xp_needed(level, system), expected)
+
     def test_oddity_is_default(self):
         """Oddity should be the default XP system."""
         self.assertEqual(calculate_xp_needed(1), calculate_xp_needed(1, 'oddity'))
         self.assertEqual(calculate_xp_needed(10), calculate_xp_needed(10, 'oddity'))
-    
-    # Classic XP System tests
-    def test_classic_xp_level_1(self):
-        """Classic: Level 1 should need 1000 XP to reach level 2."""
-        self.assertEqual(calculate_xp_needed(1, 'classic'), 1000)
-    
-    def test_classic_xp_level_10(self):
-        """Classic: Level 10 should need 10000 XP to reach level 11."""
-        self.assertEqual(calculate_xp_needed(10, 'classic'), 10000)
-    
-    def test_classic_xp_higher_levels(self):
-        """Classic: XP needed scales linearly with level * 1000."""
-        self.assertEqual(calculate_xp_needed(20, 'classic'), 20000)
-        self.assertEqual(calculate_xp_needed(25, 'classic'), 25000)
 
 
 class TestFeatDisplayNames(unittest.TestCase):
     """Tests for feat display name mapping."""
     
-    def test_single_letter_feats_mapped(self):
-        """Single letter feats should have display names."""
-        self.assertEqual(FEAT_DISPLAY_NAMES.get('o'), 'Opportunist')
-    
-    def test_two_letter_feats_mapped(self):
-        """Two letter feats should have display names."""
-        self.assertEqual(FEAT_DISPLAY_NAMES.get('pe'), 'Psi Empathy')
-    
-    def test_multiword_feats_mapped(self):
-        """Multi-word feats should have proper display names."""
-        self.assertEqual(FEAT_DISPLAY_NAMES.get('heavypunch'), 'Heavy Punch')
-        self.assertEqual(FEAT_DISPLAY_NAMES.get('lightningpunches'), 'Lightning Punches')
+    def test_known_feats_mapped(self):
+        """Known internal names (single-letter through multi-word)
+        should map to their display names."""
+        for internal, display in (('o', 'Opportunist'),
+                                  ('pe', 'Psi Empathy'),
+                                  ('heavypunch', 'Heavy Punch'),
+                                  ('lightningpunches', 'Lightning Punches')):
+            with self.subTest(feat=internal):
+                self.assertEqual(FEAT_DISPLAY_NAMES.get(internal), display)
 
 
 class TestInventoryItemDisplayNames(unittest.TestCase):
@@ -183,5 +206,370 @@ class TestInventoryCategories(unittest.TestCase):
         self.assertEqual(ITEM_CATEGORIES.get('plot'), 'Quest Items')
 
 
+class TestPackUnpack(unittest.TestCase):
+    """Tests for the packed save file format (header + gzip)."""
+
+    @classmethod
+    def setUpClass(cls):
+        """Pack the shared payload once; compression dominates this class."""
+        cls.payload = b'character data' + bytes(100) + b'more data'
+        cls.packed = pack_data(cls.payload)
+
+    def test_is_packed_true(self):
+        """Data starting with the GUID header should be detected as packed."""
+        data = PACKED_HEADER + bytes(8) + b'payload'
+        self.assertTrue(is_packed(data))
+
+    def test_is_packed_false(self):
+        """Data without the GUID header should not be detected as packed."""
+        self.assertFalse(is_packed(_PAD100))
+        self.assertFalse(is_packed(b'not a save file'))
+
+    def test_pack_data_header(self):
+        """Packed output should start with the 24-byte header."""
+        self.assertTrue(self.packed.startswith(PACKED_HEADER))
+        self.assertTrue(is_packed(self.packed))
+        self.assertGreater(len(self.packed), HEADER_SIZE)
+
+    def test_pack_unpack_round_trip(self):
+        """Packing then unpacking should return the original payload."""
+        self.assertEqual(unpack_data(self.packed), self.payload)
+
+    def test_pack_data_accepts_bytearray(self):
+        """Edited bytearray buffers should pack without conversion."""
+        payload = bytearray(b'edited save data')
+        packed = pack_data(payload)
+        self.assertEqual(unpack_data(packed), bytes(payload))
+
+    def test_pack_preserves_original_header(self):
+        """Packing with an original header should keep its version bytes."""
+        header = PACKED_HEADER + b'\xC2\x32\x0B\x72\x66\x00\x00\x00'
+        packed = pack_data(b'payload', header)
+        self.assertEqual(packed[:HEADER_SIZE], header)
+        self.assertEqual(unpack_data(packed), b'payload')
+
+    def test_write_packed_file_round_trip(self):
+        """A streamed packed file should unpack to the original payload."""
+        payload = b'character data' + bytes(100)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'global.dat'
+            write_packed_file(path, payload)
+            packed = path.read_bytes()
+            self.assertTrue(is_packed(packed))
+            self.assertEqual(unpack_data(packed), payload)
+
+
+class TestRawBaseStatScan(unittest.TestCase):
+    """Tests for base attribute scanning on synthetic save data."""
+
+    def test_find_base_stats_synthetic(self):
+        """An ESI entry should decode its base and effective values."""
+        entry = ESI_PATTERN + bytes(4) + _II32.pack(7, 9)
+        data = b''.join((_PAD100, entry, _PAD100))
+        stats = find_base_stats(data)
+        self.assertEqual(len(stats), 1)
+        self.assertEqual(stats[0]['offset'], 100)
+        self.assertEqual(stats[0]['base'], 7)
+        self.assertEqual(stats[0]['effective'], 9)
+
+    def test_find_base_stats_multiple(self):
+        """Multiple ESI entries should be returned in file order."""
+        entry1 = ESI_PATTERN + bytes(4) + _II32.pack(5, 5)
+        entry2 = ESI_PATTERN + bytes(4) + _II32.pack(10, 12)
+        data = b''.join((_PAD50, entry1, _PAD50, entry2, _PAD50))
+        stats = find_base_stats(data)
+        self.assertEqual([s['base'] for s in stats], [5, 10])
+        self.assertEqual([s['effective'] for s in stats], [5, 12])
+
+    def test_find_base_stats_stops_after_seven(self):
+        """The scan should stop after the 7 attribute entries."""
+        entry = ESI_PATTERN + bytes(4) + _II32.pack(5, 5)
+        data = (entry + bytes(10)) * 9
+        self.assertEqual(len(find_base_stats(data)), 7)
+
+    def test_find_base_stats_truncated_entry_ignored(self):
+        """A marker too close to the end of the buffer should be skipped."""
+        data = b''.join((_PAD100, ESI_PATTERN, bytes(4)))
+        self.assertEqual(find_base_stats(data), [])
+
+    def test_find_base_stats_not_found(self):
+        """A buffer with no markers should return no entries."""
+        self.assertEqual(find_base_stats(_EMPTY_1K), [])
+
+
+class TestRawXPScan(unittest.TestCase):
+    """Tests for current-XP detection on synthetic save data."""
+
+    XP_PATTERN = b'eGD\x01\x00\x00\x00\x07value__\x00\x08\x02\x00\x00\x00'
+
+    def test_find_xp_synthetic(self):
+        """The int32 after the XP marker should be returned."""
+        data = b''.join((_PAD100, self.XP_PATTERN, _I32.pack(17), _PAD100))
+        self.assertEqual(find_xp(data), 17)
+
+    def test_find_xp_not_found(self):
+        """A buffer without the marker should return None."""
+        self.assertIsNone(find_xp(_EMPTY_1K))
+
+
+class TestCharacterInfoScan(unittest.TestCase):
+    """Tests for character name/level detection in synthetic info.dat data."""
+
+    @staticmethod
+    def _info_payload(name_offset, name, level):
+        """Build a synthetic info.dat buffer in one preallocated bytearray.
+
+        Writing the name and level in place avoids the chain of
+        intermediate bytes objects a + concatenation would allocate.
+        """
+        buf = bytearray(name_offset + len(name) + 4 + 200)
+        buf[name_offset:name_offset + len(name)] = name
+        _I32.pack_into(buf, name_offset + len(name), level)
+        return bytes(buf)
+
+    def test_find_character_info_synthetic(self):
+        """A name followed by a plausible level should be found."""
+        data = self._info_payload(192, b'See Me Now', 9)
+        info = find_character_info(data)
+        self.assertIsNotNone(info)
+        self.assertEqual(info['name'], 'See Me Now')
+        self.assertEqual(info['offset'], 192)
+        self.assertEqual(info['level'], 9)
+
+    def test_find_character_info_rejects_bad_level(self):
+        """A name followed by an implausible level should be rejected."""
+        data = self._info_payload(192, b'See Me Now', 5000)
+        self.assertIsNone(find_character_info(data))
+
+    def test_find_character_info_outside_window(self):
+        """A name outside the scan window should not be found."""
+        data = self._info_payload(400, b'See Me Now', 9)
+        self.assertIsNone(find_character_info(data))
+
+
+class TestRawSkillScan(unittest.TestCase):
+    """Tests for skill entry scanning on synthetic save data."""
+
+    SKC_PATTERN = b'eSKC\x02\x00\x00\x00\x02\x00\x00\x00\x09'
+
+    def test_find_skill_entries_synthetic(self):
+        """An eSKC entry should decode its base and mod values."""
+        entry = self.SKC_PATTERN + bytes(4) + _II32.pack(60, 85)
+        data = b''.join((_PAD100, entry, _PAD100))
+        skills = find_skill_entries(data)
+        self.assertEqual(len(skills), 1)
+        self.assertEqual(skills[0]['offset'], 100)
+        self.assertEqual(skills[0]['base'], 60)
+        self.assertEqual(skills[0]['mod'], 85)
+
+    def test_find_skill_entries_variable_type_id(self):
+        """The variable type ID bytes should not affect matching."""
+        entry1 = self.SKC_PATTERN + b'\xd6\x02\x00\x00' + _II32.pack(10, 10)
+        entry2 = self.SKC_PATTERN + b'\x5c\x04\x00\x00' + _II32.pack(20, 25)
+        data = b''.join((_PAD50, entry1, _PAD50, entry2, _PAD50))
+        skills = find_skill_entries(data)
+        self.assertEqual([s['base'] for s in skills], [10, 20])
+
+    def test_find_skill_entries_filters_implausible_values(self):
+        """Entries with out-of-range values should be rejected."""
+        entry = self.SKC_PATTERN + bytes(4) + _II32.pack(100000, -5)
+        data = b''.join((_PAD100, entry, _PAD100))
+        self.assertEqual(find_skill_entries(data), [])
+
+    def test_find_skill_entries_tail_window(self):
+        """Entries far beyond the 24th skill should not extend the scan."""
+        entry = self.SKC_PATTERN + bytes(4) + _II32.pack(10, 10)
+        data = (entry * 24) + bytes((1 << 20) + 1024) + entry
+        self.assertEqual(len(find_skill_entries(data)), 24)
+
+    def test_find_skill_entries_not_found(self):
+        """A buffer with no markers should return no entries."""
+        self.assertEqual(find_skill_entries(_EMPTY_1K), [])
+
+
+class TestRawSkillWrite(unittest.TestCase):
+    """Tests for in-place skill and attribute value writes."""
+
+    SKC_PATTERN = b'eSKC\x02\x00\x00\x00\x02\x00\x00\x00\x09'
+
+    def test_write_skill_value_round_trip(self):
+        """A written skill value should be read back by the scanner."""
+        entry = self.SKC_PATTERN + bytes(4) + _II32.pack(60, 85)
+        data = bytearray(b''.join((_PAD100, entry, _PAD100)))
+        offset = find_skill_entries(data)[0]['offset']
+        write_skill_value(data, offset, 100, 125)
+        self.assertEqual(read_skill_values(data, offset), (100, 125))
+
+    def test_write_skill_value_preserves_bonus(self):
+        """Omitting mod_value should keep the entry's existing bonus."""
+        entry = self.SKC_PATTERN + bytes(4) + _II32.pack(60, 85)
+        data = bytearray(b''.join((_PAD100, entry, _PAD100)))
+        offset = find_skill_entries(data)[0]['offset']
+        write_skill_value(data, offset, 100)
+        self.assertEqual(read_skill_values(data, offset), (100, 125))
+
+    def test_write_stat_value_round_trip(self):
+        """A written attribute value should be read back by the scanner."""
+        entry = ESI_PATTERN + bytes(4) + _II32.pack(7, 9)
+        data = bytearray(b''.join((_PAD100, entry, _PAD100)))
+        offset = find_base_stats(data)[0]['offset']
+        write_stat_value(data, offset, 10)
+        stats = find_base_stats(data)
+        self.assertEqual(stats[0]['base'], 10)
+        self.assertEqual(stats[0]['effective'], 12)
+
+
+class TestRawStringScan(unittest.TestCase):
+    """Tests for lowercase string extraction from synthetic save data."""
+
+    def test_find_strings_synthetic(self):
+        """Lowercase runs at or above min_length should be found."""
+        data = b''.join((_PAD50, b'stygiancoin', _PAD50))
+        strings = find_strings(data)
+        self.assertEqual(strings, [(50, 'stygiancoin')])
+
+    def test_find_strings_min_length(self):
+        """Runs shorter than min_length should be skipped."""
+        data = b''.join((_PAD10, b'abc', _PAD10, b'abcdef', _PAD10))
+        strings = find_strings(data, min_length=4)
+        self.assertEqual(strings, [(23, 'abcdef')])
+
+    def test_find_strings_bounded(self):
+        """start/end should restrict the scanned region."""
+        data = b'aaaa' + bytes(10) + b'bbbb' + bytes(10)
+        strings = find_strings(data, start=4)
+        self.assertEqual(strings, [(14, 'bbbb')])
+
+    def test_find_strings_ignores_uppercase(self):
+        """Uppercase text should not count toward a lowercase run."""
+        data = b''.join((_PAD10, b'ABCDEFGH', _PAD10))
+        self.assertEqual(find_strings(data), [])
+
+
+class TestRawPatternSearch(unittest.TestCase):
+    """Tests for generic byte pattern search on synthetic save data."""
+
+    def test_search_pattern_found(self):
+        """A pattern should be found at the correct offset with context."""
+        data = b''.join((_PAD100, b'eSKC', _PAD100))
+        hits = search_pattern(data, b'eSKC', context_size=4)
+        self.assertEqual(len(hits), 1)
+        self.assertEqual(hits[0]['offset'], 100)
+        self.assertEqual(hits[0]['context'], bytes(4) + b'eSKC' + bytes(4))
+
+    def test_search_pattern_context_clamped_at_start(self):
+        """Context should be clamped at the start of the buffer."""
+        data = b'eSKC' + bytes(100)
+        hits = search_pattern(data, b'eSKC', context_size=8)
+        self.assertEqual(hits[0]['offset'], 0)
+        self.assertEqual(hits[0]['context'], b'eSKC' + bytes(8))
+
+    def test_search_pattern_multiple_hits(self):
+        """All occurrences should be reported in offset order."""
+        data = b''.join((_PAD10, b'XYZ', _PAD10, b'XYZ', _PAD10))
+        hits = search_pattern(data, b'XYZ')
+        self.assertEqual([h['offset'] for h in hits], [10, 23])
+
+    def test_search_pattern_result_cap(self):
+        """The scan should stop once max_results hits are collected."""
+        data = b'AB' * 100
+        hits = search_pattern(data, b'AB', max_results=5)
+        self.assertEqual(len(hits), 5)
+
+    def test_search_pattern_not_found(self):
+        """A missing pattern should produce no hits."""
+        self.assertEqual(search_pattern(_PAD100, b'eSKC'), [])
+
+
+class TestRawFeatScan(unittest.TestCase):
+    """Tests for raw feat scanning on synthetic save data."""
+
+    def test_find_feats_synthetic(self):
+        """A length-prefixed feat name should be found."""
+        data = b''.join((_PAD100, bytes([6]), b'nimble', _PAD100))
+        feats = find_feats(data)
+        self.assertEqual(len(feats), 1)
+        self.assertEqual(feats[0]['name'], 'nimble')
+        self.assertEqual(feats[0]['offset'], 101)
+        self.assertEqual(feats[0]['length_prefix'], 6)
+
+    def test_multiple_feats_sorted_by_offset(self):
+        """Multiple feats should be returned in offset order."""
+        data = b''.join((_PAD50, bytes([8]), b'snooping', _PAD50,
+                         bytes([2]), b'pe', _PAD50))
+        feats = find_feats(data)
+        names = [f['name'] for f in feats]
+        self.assertEqual(names, ['snooping', 'pe'])
+
+    def test_wrong_length_prefix_rejected(self):
+        """A feat name without the correct length prefix should be ignored."""
+        data = b''.join((_PAD100, bytes([99]), b'nimble', _PAD100))
+        feats = find_feats(data)
+        self.assertEqual(feats, [])
+
+    def test_find_feats_not_found(self):
+        """Empty data should return no feats."""
+        self.assertEqual(find_feats(_EMPTY_1K), [])
+
+    def test_find_feats_bounded_window(self):
+        """skills_region_end should restrict the scan to the window after it."""
+        data = (bytes([6]) + b'nimble' + bytes(100) +
+                bytes([6]) + b'sprint' + bytes(100))
+        feats = find_feats(data, skills_region_end=50)
+        self.assertEqual([f['name'] for f in feats], ['sprint'])
+
+    def test_filter_feat_strings(self):
+        """Feats should be recoverable from a find_strings pass."""
+        data = b''.join((_PAD50, bytes([6]), b'nimble', _PAD50,
+                         b'notafeat', _PAD50))
+        feats = filter_feat_strings(find_strings(data), data)
+        self.assertEqual(len(feats), 1)
+        self.assertEqual(feats[0]['name'], 'nimble')
+        self.assertEqual(feats[0]['offset'], 51)
+
+    def test_filter_feat_strings_rejects_bad_prefix(self):
+        """Strings without a matching length prefix should be rejected."""
+        data = b''.join((_PAD50, b'nimble', _PAD50))
+        self.assertEqual(filter_feat_strings(find_strings(data), data), [])
+
+    def test_has_feat_present(self):
+        """has_feat should find a length-prefixed feat name."""
+        data = b''.join((_PAD100, bytes([6]), b'nimble', _PAD100))
+        self.assertTrue(has_feat(data, 'nimble'))
+
+    def test_has_feat_requires_length_prefix(self):
+        """has_feat should reject a name without its length prefix."""
+        data = b''.join((_PAD100, b'nimble', _PAD100))
+        self.assertFalse(has_feat(data, 'nimble'))
+
+
+class TestRawFullAnalysis(unittest.TestCase):
+    """Tests for the combined single-pass analysis."""
+
+    SKC_PATTERN = b'eSKC\x02\x00\x00\x00\x02\x00\x00\x00\x09'
+    XP_PATTERN = TestRawXPScan.XP_PATTERN
+
+    def test_full_analysis_synthetic(self):
+        """All scanners should report their findings from one buffer."""
+        stat = ESI_PATTERN + bytes(4) + _II32.pack(7, 9)
+        skill = self.SKC_PATTERN + bytes(4) + _II32.pack(60, 85)
+        data = b''.join((_PAD100, stat, _PAD50, skill, _PAD50,
+                         bytes([6]), b'nimble', _PAD50,
+                         self.XP_PATTERN, _I32.pack(17), _PAD100))
+        results = full_analysis(data)
+        self.assertEqual([s['base'] for s in results['skills']], [60])
+        self.assertEqual([s['base'] for s in results['stats']], [7])
+        self.assertEqual([f['name'] for f in results['feats']], ['nimble'])
+        self.assertEqual(results['xp'], 17)
+
+    def test_full_analysis_empty(self):
+        """An empty buffer should produce empty results throughout."""
+        results = full_analysis(_EMPTY_1K)
+        self.assertEqual(results['skills'], [])
+        self.assertEqual(results['stats'], [])
+        self.assertEqual(results['feats'], [])
+        self.assertIsNone(results['xp'])
+
+
 if __name__ == '__main__':
     unittest.main()
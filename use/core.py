@@ -10,8 +10,15 @@ This module handles:
 All other modules (viewer, editor) import from here.
 """
 
+import functools
+import os
+import re
+import stat
+import sys
 from pathlib import Path
 from typing import Optional
+from . import rawscan
+from .item_names import get_display_name
 from .ufe_parser import parse_save, SaveData, UFEError
 
 
@@ -19,27 +26,13 @@ from .ufe_parser import parse_save, SaveData, UFEError
 # Constants
 # =============================================================================
 
-# Base attribute names in save file order
-STAT_NAMES = ['Strength', 'Dexterity', 'Agility', 'Constitution', 'Perception', 'Will', 'Intelligence']
+# Base attribute names in save file order. These never change at
+# runtime, so they are tuples rather than lists.
+STAT_NAMES = ('Strength', 'Dexterity', 'Agility', 'Constitution', 'Perception', 'Will', 'Intelligence')
 
-# Skill names - base game (23 skills)
-SKILL_NAMES_BASE = [
-    # Offense
-    "Guns", "Heavy Guns", "Throwing", "Crossbows", "Melee",
-    # Defense
-    "Dodge", "Evasion",
-    # Subterfuge
-    "Stealth", "Hacking", "Lockpicking", "Pickpocketing", "Traps",
-    # Technology
-    "Mechanics", "Electronics", "Chemistry", "Biology", "Tailoring",
-    # Psi
-    "Thought Control", "Psychokinesis", "Metathermics",
-    # Social
-    "Persuasion", "Intimidation", "Mercantile",
-]
-
-# Skill names - with Expedition DLC (24 skills, adds Temporal Manipulation)
-SKILL_NAMES_DLC = [
+# Skill names - with Expedition DLC (24 skills). This is the canonical
+# list; the base-game list is derived from it below.
+SKILL_NAMES_DLC = (
     # Offense
     "Guns", "Heavy Guns", "Throwing", "Crossbows", "Melee",
     # Defense
@@ -52,7 +45,11 @@ SKILL_NAMES_DLC = [
     "Thought Control", "Psychokinesis", "Metathermics", "Temporal Manipulation",
     # Social
     "Persuasion", "Intimidation", "Mercantile",
-]
+)
+
+# Skill names - base game (23 skills): the DLC list without Temporal
+# Manipulation (index 20). Deriving it keeps the two lists in sync.
+SKILL_NAMES_BASE = SKILL_NAMES_DLC[:20] + SKILL_NAMES_DLC[21:]
 
 # Skill categories for display grouping
 SKILL_CATEGORIES = {
@@ -107,6 +104,12 @@ ITEM_CATEGORIES = {
     'plot': 'Quest Items',
 }
 
+# Keys coming out of parsed saves are freshly-built strings; interning
+# both lookup tables once here precomputes the hashes so the hot .get()
+# calls below resolve with a pointer comparison on a hit.
+FEAT_DISPLAY_NAMES = {sys.intern(k): sys.intern(v) for k, v in FEAT_DISPLAY_NAMES.items()}
+ITEM_CATEGORIES = {sys.intern(k): sys.intern(v) for k, v in ITEM_CATEGORIES.items()}
+
 
 # =============================================================================
 # Path Resolution
@@ -150,26 +153,34 @@ def resolve_save_path(path_input: str | Path | None = None) -> Path:
     else:
         path = Path(path_input).resolve()
     
-    if not path.exists():
+    # One stat() per path instead of separate exists()/is_file()/is_dir()
+    # probes, which each issue their own syscall
+    try:
+        st = os.stat(path)
+    except OSError:
         raise FileNotFoundError(f"Path not found: {path}")
-    
-    if path.is_file():
+
+    if stat.S_ISREG(st.st_mode):
         return path
-    
-    if path.is_dir():
+
+    if stat.S_ISDIR(st.st_mode):
         candidates = [
             path / "global.dat",
             path / "global" / "global",
         ]
         for candidate in candidates:
-            if candidate.exists() and candidate.is_file():
+            try:
+                cand_st = os.stat(candidate)
+            except OSError:
+                continue
+            if stat.S_ISREG(cand_st.st_mode):
                 return candidate
-        
+
         raise FileNotFoundError(
             f"No save file found in directory: {path}\n"
             f"Expected 'global.dat' or 'global/global'"
         )
-    
+
     raise FileNotFoundError(f"Path is neither file nor directory: {path}")
 
 
@@ -192,32 +203,44 @@ def find_save_file(save_dir: str | Path | None = None) -> Optional[Path]:
 # Cache for parsed save data
 _save_cache: dict[Path, SaveData] = {}
 
+# Memo of raw path inputs to resolved paths. resolve_save_path stats the
+# filesystem, so repeat loads of the same input skip those syscalls. A
+# None input resolves relative to the current directory and is never
+# memoized.
+_path_cache: dict[str, Path] = {}
+
 
 def load_save_data(path_input: str | Path | None = None, use_cache: bool = True) -> SaveData:
     """
     Load and parse a save file, returning structured SaveData.
-    
+
     Args:
         path_input: Path to save file, directory, or None for current directory
         use_cache: If True, return cached data if available
-    
+
     Returns:
         SaveData object with parsed game data
     """
-    path = resolve_save_path(path_input)
-    
+    key = str(path_input) if path_input is not None else None
+    path = _path_cache.get(key) if key is not None else None
+    if path is None:
+        path = resolve_save_path(path_input)
+        if key is not None:
+            _path_cache[key] = path
+
     if use_cache and path in _save_cache:
         return _save_cache[path]
-    
+
     save_data = parse_save(path, keep_json=False)
     _save_cache[path] = save_data
-    
+
     return save_data
 
 
 def clear_cache():
-    """Clear the save data cache."""
+    """Clear the save data and path resolution caches."""
     _save_cache.clear()
+    _path_cache.clear()
 
 
 # =============================================================================
@@ -237,10 +260,14 @@ def get_skill_entries(data_or_path) -> list:
         save_data = data_or_path
     else:
         save_data = load_save_data(data_or_path)
-    
+
+    cached = save_data._derived_cache.get('skill_entries')
+    if cached is not None:
+        return cached
+
     raw_skills = save_data.get_skills()
     skill_names = get_skill_names(len(raw_skills))
-    
+
     results = []
     for i, skill in enumerate(raw_skills):
         name = skill_names[i] if i < len(skill_names) else f"Skill {i}"
@@ -250,12 +277,34 @@ def get_skill_entries(data_or_path) -> list:
             'mod': skill['effective'],
             'offset': i  # Use index as offset for compatibility
         })
-    
+
+    save_data._derived_cache['skill_entries'] = results
     return results
 
 
-def get_skill_names(num_skills: int) -> list:
-    """Return appropriate skill name list based on detected skill count."""
+def get_skill_index(data_or_path) -> dict:
+    """
+    Get a name -> skill entry mapping for O(1) lookups.
+
+    Cached per SaveData instance alongside the entry list.
+    """
+    if isinstance(data_or_path, SaveData):
+        save_data = data_or_path
+    else:
+        save_data = load_save_data(data_or_path)
+
+    cached = save_data._derived_cache.get('skill_index')
+    if cached is not None:
+        return cached
+
+    index = {entry['name']: entry for entry in get_skill_entries(save_data)}
+    save_data._derived_cache['skill_index'] = index
+    return index
+
+
+@functools.lru_cache(maxsize=2)
+def get_skill_names(num_skills: int) -> tuple:
+    """Return appropriate skill name tuple based on detected skill count."""
     if num_skills >= 24:
         return SKILL_NAMES_DLC
     return SKILL_NAMES_BASE
@@ -378,6 +427,11 @@ def detect_xp_system(data_or_path) -> tuple:
     return ('classic', False)
 
 
+# Oddity XP requirements by level, precomputed from the 2*(level+1)
+# ramp that caps at 30 from level 14 on. Indexed with min(level, 14).
+_ODDITY_XP = tuple(30 if lvl >= 14 else 2 * (lvl + 1) for lvl in range(15))
+
+
 def calculate_xp_needed(level: int, xp_system: str = 'oddity') -> int:
     """
     Estimate XP needed to reach the next level.
@@ -385,10 +439,7 @@ def calculate_xp_needed(level: int, xp_system: str = 'oddity') -> int:
     """
     if xp_system == 'classic':
         return level * 1000
-    else:
-        if level >= 14:
-            return 30
-        return 2 * (level + 1)
+    return _ODDITY_XP[min(level, 14)]
 
 
 # =============================================================================
@@ -473,41 +524,44 @@ def find_feats(data_or_path, skills: list = None) -> list:
 # Inventory
 # =============================================================================
 
+# Precompiled pieces of the fallback name conversion below. Compiling
+# the regexes (and freezing the acronym set) once at import keeps the
+# per-item cost down when rendering large inventories.
+_CAMEL_RE = re.compile(r'([a-z])([A-Z])')
+_TRAILING_NUM_RE = re.compile(r'([a-zA-Z])(\d+)$')
+_ACRONYMS = frozenset({'emp', 'he', 'tnt', 'smg', 'em', 'jhp', 'ap', 'hp', 'sgs', 'li', 'ai', 'mk'})
+
+
+@functools.lru_cache(maxsize=1024)
 def _extract_item_display_name(path: str) -> str:
     """
     Convert item path to display name.
-    
+
     Uses item name mappings extracted from game files (.item files in rules/items/).
     Falls back to pattern-based conversion for unmapped items.
+
+    Memoized: inventories repeat the same item paths for every stack,
+    so most calls are cache hits.
     """
-    import re
-    from .item_names import get_display_name
-    
-    name = path.split('\\')[-1]
-    name_lower = name.lower()
-    
+    name = path.rpartition('\\')[2]
+
     # First, try to get the display name from game file mappings
-    display_name = get_display_name(name_lower)
+    display_name = get_display_name(name.lower())
     if display_name:
         return display_name
-    
+
     # Fallback: pattern-based conversion for unmapped items
     name = name.replace('_', ' ')
-    name = re.sub(r'([a-z])([A-Z])', r'\1 \2', name)
-    name = re.sub(r'([a-zA-Z])(\d+)$', r'\1 \2', name)
-    
-    words = name.split()
+    name = _CAMEL_RE.sub(r'\1 \2', name)
+    name = _TRAILING_NUM_RE.sub(r'\1 \2', name)
+
     result_words = []
-    
-    acronyms = {'emp', 'he', 'tnt', 'smg', 'em', 'jhp', 'ap', 'hp', 'sgs', 'li', 'ai', 'mk'}
-    
-    for word in words:
-        word_lower = word.lower()
-        if word_lower in acronyms:
+    for word in name.split():
+        if word.lower() in _ACRONYMS:
             result_words.append(word.upper())
         else:
             result_words.append(word.capitalize())
-    
+
     return ' '.join(result_words)
 
 
@@ -776,52 +830,43 @@ def calculate_total_skill_points(level: int) -> int:
 
 
 # =============================================================================
-# Legacy Compatibility
+# Raw Binary Access
 # =============================================================================
 
-# These functions are kept for backward compatibility but now use UFE
+# Structured access goes through UFE (load_save_data); these give direct
+# access to the raw packed format for analysis and platforms without UFE.
 
 def load_save(path_input: str | Path | None = None) -> bytes:
     """
-    Legacy function - loads save data.
-    
-    Note: This now returns an empty bytes object since UFE handles parsing.
-    Use load_save_data() instead for the new API.
+    Load raw unpacked save bytes.
+
+    Resolves the path like load_save_data(), then unpacks the file natively
+    (no UFE required). Use load_save_data() for structured access.
     """
-    # For backward compatibility, just return empty bytes
-    # The actual parsing is done via load_save_data()
-    return b''
+    path = resolve_save_path(path_input)
+    return rawscan.load_save(path)
 
 
 def is_packed(data: bytes) -> bool:
-    """Legacy function - always returns True (UFE handles packing)."""
-    return True
+    """Check whether data is in the packed save format."""
+    return rawscan.is_packed(data)
 
 
 def unpack_data(packed_data: bytes) -> bytes:
-    """Legacy function - returns input (UFE handles unpacking)."""
-    return packed_data
+    """Unpack packed save data (24-byte header + gzip stream)."""
+    return rawscan.unpack_data(packed_data)
 
 
-def pack_data(unpacked_data: bytes) -> bytes:
-    """Legacy function - returns input (not implemented with UFE)."""
-    raise NotImplementedError(
-        "Direct binary packing is not supported with UFE parser. "
-        "Use UFE's patch functionality instead."
-    )
+def pack_data(unpacked_data: bytes, header: bytes = None) -> bytes:
+    """Pack save data back into the packed format."""
+    return rawscan.pack_data(unpacked_data, header)
 
 
 def write_skill_value(data: bytearray, offset: int, base_value: int, mod_value: int = None):
-    """Legacy function - not implemented with UFE parser."""
-    raise NotImplementedError(
-        "Direct binary writing is not supported with UFE parser. "
-        "Use UFE's patch functionality instead."
-    )
+    """Write a skill's values into unpacked save bytes in place."""
+    rawscan.write_skill_value(data, offset, base_value, mod_value)
 
 
 def write_stat_value(data: bytearray, offset: int, base_value: int, effective_value: int = None):
-    """Legacy function - not implemented with UFE parser."""
-    raise NotImplementedError(
-        "Direct binary writing is not supported with UFE parser. "
-        "Use UFE's patch functionality instead."
-    )
+    """Write an attribute's values into unpacked save bytes in place."""
+    rawscan.write_stat_value(data, offset, base_value, effective_value)
@@ -19,19 +19,85 @@ from .core import (
 )
 
 
+def run_batch(editor, save_data, batch_path):
+    """
+    Apply edits from a batch file without prompting.
+
+    The file contains one 'Name=value' line per edit, where Name is a
+    skill or attribute display name (case insensitive). Blank lines and
+    lines starting with '#' are ignored.
+
+    Returns the number of edits applied.
+    """
+    skills = save_data.get_skills()
+    skill_names = get_skill_names(len(skills))
+    skill_index = {name.lower(): i for i, name in enumerate(skill_names)}
+
+    attr_index = {}
+    for i, attr in enumerate(save_data.get_base_attributes()):
+        name = attr.get('name') or (STAT_NAMES[i] if i < len(STAT_NAMES) else '')
+        if name:
+            attr_index[name.lower()] = i
+
+    applied = 0
+    with open(batch_path, 'r', encoding='utf-8') as f:
+        for line_no, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith('#'):
+                continue
+
+            if '=' not in line:
+                print(f"  Line {line_no}: expected 'Name=value', got '{line}'")
+                continue
+
+            name, _, value = line.partition('=')
+            name = name.strip()
+            try:
+                new_base = int(value.strip())
+            except ValueError:
+                print(f"  Line {line_no}: '{value.strip()}' is not a number")
+                continue
+
+            name_key = name.lower()
+            if name_key in skill_index:
+                ok = editor.set_skill_value(skill_index[name_key], new_base)
+            elif name_key in attr_index:
+                ok = editor.set_attribute_value(attr_index[name_key], new_base)
+            else:
+                print(f"  Line {line_no}: unknown skill or attribute '{name}'")
+                continue
+
+            if ok:
+                applied += 1
+                print(f"  {name}: set to {new_base}")
+            else:
+                print(f"  Line {line_no}: failed to update '{name}'")
+
+    return applied
+
+
 def main(args=None):
     """Main entry point for the editor."""
     print("=" * 60)
     print("Underrail Save File Editor")
     print("=" * 60)
     print()
-    
+
     # Track whether to ignore warnings
     ignore_warnings = False
     first_warning = True
-    
-    # Resolve save file path from args
-    path_arg = args[0] if args and len(args) > 0 else None
+
+    # Resolve save file path and batch file from args
+    batch_file = None
+    args = list(args) if args else []
+    if '--batch' in args:
+        batch_idx = args.index('--batch')
+        if batch_idx + 1 >= len(args):
+            print("ERROR: --batch requires a file argument.")
+            sys.exit(1)
+        batch_file = args[batch_idx + 1]
+        del args[batch_idx:batch_idx + 2]
+    path_arg = args[0] if len(args) > 0 else None
     input_file = find_save_file(path_arg)
     
     if input_file is None:
@@ -58,7 +124,35 @@ def main(args=None):
         sys.exit(1)
     
     print()
-    
+
+    # Non-interactive batch mode: apply edits from the file and save
+    if batch_file:
+        print(f"Batch mode: applying edits from '{batch_file}'")
+        try:
+            applied = run_batch(editor, save_data, batch_file)
+        except OSError as e:
+            print(f"ERROR: Could not read batch file: {e}")
+            editor.cleanup()
+            sys.exit(1)
+
+        if not editor.has_changes():
+            print("No changes made.")
+            editor.cleanup()
+            sys.exit(0)
+
+        print()
+        print(f"Saving {applied} change(s)...")
+        try:
+            editor.save()
+            editor.apply(validate=True, cleanup_json=True)
+            print("Save complete!")
+        except UFEError as e:
+            print(f"ERROR: Failed to apply changes: {e}")
+            print("Your original save file should be unchanged.")
+            editor.cleanup()
+            sys.exit(1)
+        return
+
     # Get character info
     char_name = save_data.get_character_name()
     char_level = save_data.get_character_level()
@@ -0,0 +1,631 @@
+#!/usr/bin/env python3
+"""
+Raw save-file scanning helpers for Underrail Save Editor.
+
+These functions operate directly on unpacked save bytes, without requiring
+UFE (Underrail File Exporter). They implement the byte-level patterns
+documented in AI_README.md and provide a fallback/analysis path on
+platforms where UFE.exe is unavailable.
+
+All scanners take unpacked save data as a bytes-like object.
+"""
+
+import binascii
+import gzip
+import mmap
+import re
+import struct
+import sys
+import zlib
+
+
+# =============================================================================
+# Packed File I/O
+# =============================================================================
+
+# GUID header identifying a packed save file (see AI_README.md
+# "Packed File Format"). Packed files are this header, 8 version bytes,
+# then a gzip stream.
+PACKED_HEADER = bytes.fromhex('F9538B831F363243BAAE0D17865D0854')
+
+# Total header size before the gzip stream: 16-byte GUID + 8 version bytes
+HEADER_SIZE = 24
+
+# Default version bytes used when packing data without an original header
+_DEFAULT_VERSION = bytes(8)
+_DEFAULT_HEADER = PACKED_HEADER + _DEFAULT_VERSION
+
+
+def is_packed(data: bytes) -> bool:
+    """Check whether data starts with the packed-save GUID header."""
+    # startswith is a direct memcmp; slicing the prefix out first would
+    # allocate a throwaway copy.
+    return data.startswith(PACKED_HEADER)
+
+
+# Output chunk size for _inflate. Bounded chunks keep the decompressor
+# from repeatedly growing one huge output buffer as multi-MB saves
+# expand; 128 KiB matches the buffer size the gzip module itself uses.
+_INFLATE_CHUNK = 128 * 1024
+
+
+def _inflate(compressed) -> bytes:
+    """
+    Decompress a gzip stream with zlib directly.
+
+    zlib.decompressobj(wbits=31) understands the gzip framing but skips
+    the gzip module's extra header/CRC bookkeeping passes, which is
+    measurable on multi-MB saves. Output is produced in bounded chunks
+    and joined once at the end.
+    """
+    d = zlib.decompressobj(wbits=31)
+    chunks = [d.decompress(compressed, _INFLATE_CHUNK)]
+    while d.unconsumed_tail:
+        chunks.append(d.decompress(d.unconsumed_tail, _INFLATE_CHUNK))
+    chunks.append(d.flush())
+    return b''.join(chunks)
+
+
+def unpack_data(packed_data: bytes) -> bytes:
+    """Unpack a packed save: skip the 24-byte header, decompress the rest."""
+    return _inflate(memoryview(packed_data)[HEADER_SIZE:])
+
+
+def pack_data(unpacked_data: bytes, header: bytes = None) -> bytes:
+    """
+    Pack save data: prepend the 24-byte header, gzip-compress the payload.
+
+    Pass the original file's header to preserve its version bytes;
+    otherwise a default header with zeroed version bytes is used.
+
+    Accepts any bytes-like payload (bytes, bytearray, memoryview, mmap),
+    so edited buffers compress directly without a bytes() copy first.
+    """
+    if header is None:
+        header = _DEFAULT_HEADER
+    # zlib with wbits=31 emits the same gzip framing as gzip.compress
+    # but without constructing a GzipFile/BytesIO pair per call (and
+    # with a zeroed mtime field, so identical payloads pack
+    # identically).
+    c = zlib.compressobj(6, zlib.DEFLATED, 31)
+    return b''.join((header[:HEADER_SIZE], c.compress(memoryview(unpacked_data)),
+                     c.flush()))
+
+
+def write_packed_file(path, unpacked_data, header: bytes = None) -> None:
+    """
+    Write save data to a packed file, streaming the compression.
+
+    Unlike header + pack_data(...), the compressed stream goes straight to
+    the file through gzip's window buffer, so peak memory stays at the
+    size of the input instead of input plus the full compressed output.
+    """
+    if header is None:
+        header = _DEFAULT_HEADER
+    with open(path, 'wb') as f:
+        f.write(header[:HEADER_SIZE])
+        with gzip.GzipFile(fileobj=f, mode='wb', compresslevel=6) as gz:
+            gz.write(memoryview(unpacked_data))
+
+
+def load_save(path) -> bytes:
+    """
+    Load a save file and return its unpacked contents.
+
+    Packed files (global.dat, info.dat) are decompressed into bytes.
+    Already-unpacked files are memory-mapped read-only, so scanners operate
+    directly on page-cache pages without copying the file into a buffer.
+    """
+    with open(path, 'rb') as f:
+        # Classify from the header alone so unpacked files aren't pulled
+        # into memory just to check the magic bytes.
+        head = f.read(HEADER_SIZE)
+        if is_packed(head):
+            return _inflate(f.read())
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+# =============================================================================
+# Hexdump
+# =============================================================================
+
+# Maps printable ASCII to itself and everything else to '.', so the ASCII
+# column of a hexdump line is one C-level translate call instead of a
+# per-byte Python loop.
+_ASCII_TABLE = bytes(c if 32 <= c <= 126 else 0x2E for c in range(256))
+
+
+def hexdump(data: bytes, offset: int = 0, length: int = 256) -> None:
+    """
+    Print a hexdump of a region of save data.
+
+    Each line shows the absolute offset, 16 bytes as hex, and the printable
+    ASCII rendering of those bytes.
+    """
+    end = min(offset + length, len(data))
+    lines = []
+    for line_start in range(offset, end, 16):
+        chunk = data[line_start:min(line_start + 16, end)]
+        hex_part = binascii.hexlify(chunk, b' ').decode()
+        ascii_part = chunk.translate(_ASCII_TABLE).decode('latin1')
+        lines.append(f'{line_start:08x}  {hex_part:<47}  {ascii_part}')
+
+    # One buffered write instead of a print (lock + possible flush) per line
+    if lines:
+        lines.append('')
+        sys.stdout.write('\n'.join(lines))
+
+
+# =============================================================================
+# Base Attributes
+# =============================================================================
+
+# Marker preceding each base attribute entry (see AI_README.md).
+# The pattern is followed by a 4-byte variable type ID, then the base and
+# effective values as int32 little-endian.
+ESI_PATTERN = b'ESI\x02\x00\x00\x00\x02\x00\x00\x00\x09'
+
+# Precompiled int32 codecs shared by the scanners and the in-place
+# read/write helpers; avoid reparsing the format string on every call.
+_I = struct.Struct('<i')
+_II = struct.Struct('<ii')
+
+# Full entry matched in one pass: marker, 4-byte variable type ID, then the
+# captured base/effective value bytes. Matching the whole entry in the regex
+# engine replaces the Python-level find/step loop and drops truncated
+# trailing entries for free.
+_ESI_RE = re.compile(re.escape(ESI_PATTERN) + b'....(........)', re.DOTALL)
+
+# Distance from a marker's start to its value pair: the marker itself plus
+# the 4-byte variable type ID.
+_ESI_VALUE_DELTA = len(ESI_PATTERN) + 4
+
+# There are exactly 7 base attributes (see STAT_NAMES); entries past that
+# would be discarded anyway, so the scan stops once 7 entries have been
+# collected.
+MAX_STATS = 7
+
+
+def find_base_stats(data: bytes) -> list:
+    """
+    Find base attribute entries in unpacked save data.
+
+    Attributes use the ESI marker documented in AI_README.md. The 4-byte
+    variable type ID after the marker is skipped; the two int32 values that
+    follow are the base and effective attribute values.
+
+    Implausible value pairs are filtered out as false positives; the ESI
+    marker also matches a handful of non-attribute records on real saves,
+    with decoded values far outside the attribute range.
+
+    Returns list of dicts with 'offset', 'base', 'effective' keys, in file
+    order (which matches STAT_NAMES order). At most MAX_STATS valid
+    entries are collected; the scan ends at the last one instead of
+    walking the rest of the file.
+    """
+    results = []
+    for m in _ESI_RE.finditer(data):
+        g = m.group(1)
+        # High-half prefilter as in the skill scan: plausible attribute
+        # values are small non-negative ints, so a nonzero upper half in
+        # either int32 marks a false-positive marker hit.
+        if g[2] | g[3] | g[6] | g[7]:
+            continue
+        base, effective = _II.unpack(g)
+        # Base attributes start at 3 and level-ups keep them small;
+        # effective can be boosted (or drained) by gear and effects.
+        if 1 <= base <= 30 and 1 <= effective <= 100:
+            results.append({
+                'offset': m.start(),
+                'base': base,
+                'effective': effective,
+            })
+            if len(results) >= MAX_STATS:
+                break
+
+    return results
+
+
+# =============================================================================
+# Skills
+# =============================================================================
+
+# Marker preceding each skill entry (see AI_README.md). Compiled so the
+# scan runs inside the regex engine, which resumes after each hit without
+# Python-level index bookkeeping.
+_SKC_PATTERN = b'eSKC\x02\x00\x00\x00\x02\x00\x00\x00\x09'
+_SKC_RE = re.compile(re.escape(_SKC_PATTERN))
+
+# Distance from a marker's start to its value pair: the marker itself plus
+# the 4-byte variable type ID.
+_SKC_VALUE_DELTA = len(_SKC_PATTERN) + 4
+
+# Real saves have 23 (base game) or 24 (Expedition DLC) skills. Once 24
+# validated entries are in hand, only this much further is scanned for
+# stragglers before giving up on the rest of the file.
+MAX_SKILLS = 24
+_SKILL_TAIL_WINDOW = 1 << 20
+
+
+def _scan_skill_pairs(data: bytes) -> list:
+    """
+    Internal skill scan returning plain (offset, base, mod) tuples.
+
+    Tuples are much cheaper than dicts per entry; aggregate consumers
+    (totals, counts) can use these directly, and the public API
+    materializes dicts only at the boundary.
+    """
+    results = []
+    pos = 0
+    endpos = len(data)
+    while True:
+        m = _SKC_RE.search(data, pos, endpos)
+        if m is None:
+            break
+        value_offset = m.end() + 4
+        if value_offset + 8 <= len(data):
+            # Plausible values are small non-negative ints, so the upper
+            # half of each int32 must be zero; OR-ing those four bytes
+            # rejects most false positives without decoding (negative
+            # values have 0xff high bytes and fail this too).
+            if (data[value_offset + 2] | data[value_offset + 3] |
+                    data[value_offset + 6] | data[value_offset + 7]):
+                pos = m.end()
+                continue
+            base, mod = _II.unpack_from(data, value_offset)
+            if base <= 300 and mod <= 600:
+                results.append((m.start(), base, mod))
+                if len(results) >= MAX_SKILLS:
+                    # Everything past the last skill is post-skill data;
+                    # stop scanning once the tail window is exhausted.
+                    endpos = min(endpos, m.end() + _SKILL_TAIL_WINDOW)
+        pos = m.end()
+
+    return results
+
+
+def find_skill_entries(data: bytes) -> list:
+    """
+    Find skill entries in unpacked save data.
+
+    Skills use the eSKC marker documented in AI_README.md. The 4 bytes
+    after the marker are a variable type ID (changes between saves, never
+    matched); the two int32 values that follow are the base and effective
+    skill values. Implausible value pairs are filtered out as false
+    positives.
+
+    Returns list of dicts with 'offset', 'base', 'mod' keys, in file order
+    (which matches the skill order in the game UI).
+    """
+    return [
+        {'offset': offset, 'base': base, 'mod': mod}
+        for offset, base, mod in _scan_skill_pairs(data)
+    ]
+
+
+def read_skill_values(data: bytes, offset: int) -> tuple:
+    """
+    Read (base, mod) for the skill entry at the given marker offset.
+
+    The offset is as returned by find_skill_entries. Reads in place via
+    unpack_from; no slice of the buffer is allocated.
+    """
+    return _II.unpack_from(data, offset + _SKC_VALUE_DELTA)
+
+
+def write_skill_value(data: bytearray, offset: int, base_value: int,
+                      mod_value: int = None) -> None:
+    """
+    Write a skill entry's base and mod values in place.
+
+    The offset is as returned by find_skill_entries. If mod_value is None,
+    the entry's existing bonus (mod - base) is preserved on top of the new
+    base value.
+    """
+    value_offset = offset + _SKC_VALUE_DELTA
+    if mod_value is None:
+        old_base, old_mod = _II.unpack_from(data, value_offset)
+        mod_value = base_value + (old_mod - old_base)
+        if mod_value < 0:
+            mod_value = base_value
+    _II.pack_into(data, value_offset, base_value, mod_value)
+
+
+def write_stat_value(data: bytearray, offset: int, base_value: int,
+                     effective_value: int = None) -> None:
+    """
+    Write a base attribute entry's base and effective values in place.
+
+    The offset is as returned by find_base_stats. If effective_value is
+    None, the entry's existing bonus is preserved on top of the new base
+    value.
+    """
+    value_offset = offset + _ESI_VALUE_DELTA
+    if effective_value is None:
+        old_base, old_eff = _II.unpack_from(data, value_offset)
+        effective_value = base_value + (old_eff - old_base)
+        if effective_value < 1:
+            effective_value = base_value
+    _II.pack_into(data, value_offset, base_value, effective_value)
+
+
+# =============================================================================
+# Strings
+# =============================================================================
+
+# Compiled lowercase-run patterns, keyed by minimum length. The regex engine
+# scans the buffer in C; a per-byte Python loop is 20-50x slower on the
+# multi-megabyte regions these saves contain.
+_LOWER_RE_CACHE = {}
+
+
+def find_strings(data: bytes, min_length: int = 4, start: int = 0,
+                 end: int = None) -> list:
+    """
+    Find runs of lowercase ASCII text in unpacked save data.
+
+    Game identifiers (item paths, feat names, variable names) are stored as
+    lowercase ASCII, so lowercase runs are a good first pass when exploring
+    a save region.
+
+    Returns list of (offset, string) tuples.
+    """
+    if end is None:
+        end = len(data)
+
+    pat = _LOWER_RE_CACHE.setdefault(
+        min_length, re.compile(rb'[a-z]{%d,}' % min_length)
+    )
+
+    # Scan in place via pos/endpos rather than slicing out a copy of the
+    # region first.
+    results = []
+    for m in pat.finditer(data, start, end):
+        results.append((m.start(), m.group().decode('ascii')))
+
+    return results
+
+
+def search_pattern(data: bytes, pattern: bytes, context_size: int = 20,
+                   max_results: int = 10) -> list:
+    """
+    Find occurrences of a byte pattern in unpacked save data.
+
+    Returns list of dicts with 'offset' and 'context' keys, where context
+    is the surrounding bytes (context_size on either side of the match).
+    At most max_results hits are collected (pass None for no limit); the
+    scan stops as soon as the cap is reached.
+    """
+    mv = memoryview(data)
+    pat = re.compile(re.escape(pattern))
+    n = len(data)
+    tail = len(pattern) + context_size
+    results = []
+    for m in pat.finditer(data):
+        idx = m.start()
+        s = idx - context_size
+        if s < 0:
+            s = 0
+        e = idx + tail
+        if e > n:
+            e = n
+        context = bytes(mv[s:e])
+        results.append({'offset': idx, 'context': context})
+        if max_results is not None and len(results) >= max_results:
+            break
+
+    return results
+
+
+# =============================================================================
+# Feats
+# =============================================================================
+
+# Known feat internal names (lowercase, as stored in save files).
+# Collected from FEAT_DISPLAY_NAMES plus feats observed in the test saves
+# (see AI_README.md "Feats" section).
+KNOWN_FEATS = (
+    'o',
+    'pe',
+    'heavypunch',
+    'lightningpunches',
+    'surestep',
+    'quickpockets',
+    'steadyaim',
+    'burstfire',
+    'fullautoburst',
+    'cheapshots',
+    'evasivemaneuvers',
+    'freerunning',
+    'mentalsubversion',
+    'nimble',
+    'quicktinkering',
+    'trapexpert',
+    'interloper',
+    'sprint',
+    'specialattacks',
+    'snooping',
+    'expertise',
+    'parry',
+    'deflection',
+)
+
+# All feat names compiled into a single alternation so the whole buffer is
+# scanned once, instead of one full pass per feat name. Each alternative
+# includes the length-prefix byte, so prefix validation happens inside the
+# regex engine rather than as a separate Python-level check per candidate.
+_FEAT_RE = re.compile(
+    b'|'.join(
+        bytes([len(f)]) + re.escape(f.encode('ascii'))
+        for f in sorted(KNOWN_FEATS, key=len, reverse=True)
+    )
+)
+
+# Matched entry bytes (length prefix + encoded name) back to the feat name,
+# so hits don't re-decode the name they already know.
+_FEAT_BY_ENTRY = {
+    bytes([len(f)]) + f.encode('ascii'): f for f in KNOWN_FEATS
+}
+
+
+# Feats sit shortly after the skills section; when the caller knows where
+# skills end, a window this size is enough to cover them.
+_FEAT_WINDOW = 65536
+
+
+def find_feats(data: bytes, skills_region_end: int = None) -> list:
+    """
+    Find feat entries in unpacked save data.
+
+    Feats are stored as length-prefixed lowercase strings shortly after the
+    skill data (see AI_README.md). All known feat names, each with its
+    length-prefix byte, are matched in a single pass over the buffer.
+
+    If skills_region_end is given, only the 64KB window after that offset
+    is scanned instead of the whole file.
+
+    Returns list of dicts with 'name', 'offset', 'length_prefix' keys.
+    """
+    if skills_region_end is not None:
+        start, end = skills_region_end, skills_region_end + _FEAT_WINDOW
+    else:
+        start, end = 0, len(data)
+
+    results = []
+    for match in _FEAT_RE.finditer(data, start, end):
+        entry = match.group()
+        results.append({
+            'name': _FEAT_BY_ENTRY[entry],
+            'offset': match.start() + 1,
+            'length_prefix': entry[0],
+        })
+
+    # finditer yields matches in ascending offset order, so results are
+    # already sorted.
+    return results
+
+
+# Known feat names as a set for O(1) membership tests against extracted
+# strings.
+_FEAT_SET = frozenset(KNOWN_FEATS)
+
+
+def filter_feat_strings(strings: list, data: bytes) -> list:
+    """
+    Pick feat entries out of a find_strings result.
+
+    When a lowercase-string pass over the save already exists, feats can be
+    recovered from it with hash lookups instead of a second scan of the
+    buffer: each extracted string is checked against the known feat set and
+    its length-prefix byte. Note that find_strings' default min_length of 4
+    skips the short feats ('o', 'pe'); pass min_length=1 when those matter.
+
+    Returns list of dicts in the same shape as find_feats.
+    """
+    results = []
+    for offset, s in strings:
+        if s in _FEAT_SET and offset > 0 and data[offset - 1] == len(s):
+            results.append({
+                'name': s,
+                'offset': offset,
+                'length_prefix': len(s),
+            })
+    return results
+
+
+def has_feat(data: bytes, feat: str) -> bool:
+    """
+    Check whether a single feat is present in unpacked save data.
+
+    The needle includes the length-prefix byte, so the prefix check happens
+    inside the single substring search rather than as a follow-up pass.
+    """
+    needle = bytes([len(feat)]) + feat.encode('ascii')
+    return data.find(needle) >= 0
+
+
+# =============================================================================
+# Experience Points
+# =============================================================================
+
+# Marker preceding the current-XP value (see AI_README.md). The int32 that
+# follows is XP toward the next level, not lifetime XP.
+XP_PATTERN = b'eGD\x01\x00\x00\x00\x07value__\x00\x08\x02\x00\x00\x00'
+
+
+def find_xp(data: bytes) -> int:
+    """
+    Find current XP in unpacked save data.
+
+    Returns the XP value, or None if the marker is not present. The single
+    int32 is decoded in place with unpack_from; no slice of the buffer is
+    allocated.
+    """
+    idx = data.find(XP_PATTERN)
+    if idx < 0:
+        return None
+    value_offset = idx + len(XP_PATTERN)
+    if value_offset + 4 > len(data):
+        return None
+    return _I.unpack_from(data, value_offset)[0]
+
+
+# =============================================================================
+# Character Info (info.dat)
+# =============================================================================
+
+# Printable-ASCII run, used to locate the character name in info.dat.
+_NAME_RE = re.compile(rb'[ -~]{3,30}')
+
+# The character name sits in this window of the unpacked info.dat
+# (see AI_README.md "Character Level Detection").
+_INFO_NAME_START = 180
+_INFO_NAME_END = 350
+
+
+def find_character_info(info_data: bytes) -> dict:
+    """
+    Find the character name and level in unpacked info.dat data.
+
+    The name is a printable ASCII run in a known window of the file,
+    immediately followed by the level as int32 little-endian. Candidate
+    runs are located by the regex engine; each is validated by checking
+    that the trailing int32 is a plausible level.
+
+    Returns dict with 'name', 'offset', 'level' keys, or None if no
+    candidate validates.
+    """
+    for m in _NAME_RE.finditer(info_data, _INFO_NAME_START, _INFO_NAME_END):
+        end = m.end()
+        if end + 4 <= len(info_data):
+            level = _I.unpack_from(info_data, end)[0]
+            if 1 <= level <= 30:
+                return {
+                    'name': m.group().decode('ascii'),
+                    'offset': m.start(),
+                    'level': level,
+                }
+    return None
+
+
+# =============================================================================
+# Combined Analysis
+# =============================================================================
+
+def full_analysis(data: bytes) -> dict:
+    """
+    Run all scanners over a save buffer, each exactly once.
+
+    Returns a dict with the results keyed by scanner ('skills', 'stats',
+    'feats', 'xp'), so callers summarising multiple aspects of a save
+    don't trigger a second pass per scanner. The feat scan is bounded to
+    the window after the last skill entry when skills were found.
+    """
+    skills = find_skill_entries(data)
+    skills_region_end = skills[-1]['offset'] if skills else None
+    return {
+        'skills': skills,
+        'stats': find_base_stats(data),
+        'feats': find_feats(data, skills_region_end=skills_region_end),
+        'xp': find_xp(data),
+    }
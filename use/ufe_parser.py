@@ -15,6 +15,13 @@ import shutil
 from pathlib import Path
 from typing import Any, Optional
 
+try:
+    # Optional accelerator: several times faster than stdlib json on the
+    # multi-MB UFE exports. The editor stays fully functional without it.
+    import orjson
+except ImportError:
+    orjson = None
+
 
 # Path to UFE executable (relative to project root)
 UFE_PATH = Path(__file__).parent.parent / "UFE" / "UFE.exe"
@@ -72,10 +79,28 @@ def export_to_json(save_path: Path, output_path: Optional[Path] = None) -> Path:
 
 def load_json(json_path: Path) -> dict:
     """Load and parse a JSON file exported by UFE."""
+    if orjson is not None:
+        return orjson.loads(Path(json_path).read_bytes())
     with open(json_path, 'r', encoding='utf-8') as f:
         return json.load(f)
 
 
+def export_to_json_bytes(save_path: Path) -> bytes:
+    """
+    Export a save file via UFE and return the raw JSON bytes.
+
+    UFE has no stdout mode and always writes its export next to the input
+    file, so an intermediate file still exists briefly; this reads it back
+    in binary and removes it, sparing callers the load-then-unlink dance
+    and the text-mode decode.
+    """
+    json_path = export_to_json(save_path)
+    try:
+        return json_path.read_bytes()
+    finally:
+        json_path.unlink()
+
+
 class SaveData:
     """
     Parsed save file data with easy access to game objects.
@@ -88,8 +113,16 @@ class SaveData:
         self._raw = json_data
         self._records = json_data.get('records', [])
         self._ref_map = {}  # id -> record
+        self._derived_cache = {}  # cached results of record scans
         self._build_ref_map()
-    
+
+    @classmethod
+    def from_bytes(cls, json_bytes: bytes) -> 'SaveData':
+        """Build a SaveData directly from exported JSON bytes."""
+        if orjson is not None:
+            return cls(orjson.loads(json_bytes))
+        return cls(json.loads(json_bytes))
+
     def _build_ref_map(self):
         """Build a map of object IDs to their records."""
         for record in self._records:
@@ -142,10 +175,14 @@ class SaveData:
     
     def get_root(self) -> Optional[dict]:
         """Get the root TG (The Game) object."""
-        for record in self._records:
-            if 'class' in record and record['class'].get('name') == 'TG':
-                return record['class']
-        return None
+        if 'root' not in self._derived_cache:
+            root = None
+            for record in self._records:
+                if 'class' in record and record['class'].get('name') == 'TG':
+                    root = record['class']
+                    break
+            self._derived_cache['root'] = root
+        return self._derived_cache['root']
     
     def get_player(self) -> Optional[dict]:
         """Get the player character (P2) object."""
@@ -172,13 +209,21 @@ class SaveData:
     
     def get_character_name(self) -> Optional[str]:
         """Get the character name."""
-        player = self.get_player()
-        return self.get_member(player, 'C1:N') if player else None
-    
+        if 'character_name' not in self._derived_cache:
+            player = self.get_player()
+            self._derived_cache['character_name'] = (
+                self.get_member(player, 'C1:N') if player else None
+            )
+        return self._derived_cache['character_name']
+
     def get_character_level(self) -> Optional[int]:
         """Get the character level."""
-        player = self.get_player()
-        return self.get_member(player, 'C1:L') if player else None
+        if 'character_level' not in self._derived_cache:
+            player = self.get_player()
+            self._derived_cache['character_level'] = (
+                self.get_member(player, 'C1:L') if player else None
+            )
+        return self._derived_cache['character_level']
     
     # === Base Attributes ===
     
@@ -298,8 +343,11 @@ class SaveData:
         
         Returns list of dicts with item properties.
         """
+        if 'all_items' in self._derived_cache:
+            return self._derived_cache['all_items']
+
         items = []
-        
+
         for record in self._records:
             obj = record.get('class') or record.get('class_id')
             if not obj:
@@ -316,7 +364,8 @@ class SaveData:
                     item = self._parse_item(obj)
                     if item:
                         items.append(item)
-        
+
+        self._derived_cache['all_items'] = items
         return items
     
     def _parse_item(self, obj: dict) -> Optional[dict]:
@@ -438,8 +487,11 @@ class SaveData:
         - battery: current battery/energy
         - max_battery: max battery (from instance, if present)
         """
+        if 'item_instances' in self._derived_cache:
+            return self._derived_cache['item_instances']
+
         instances = {}
-        
+
         for record in self._records:
             obj = record.get('class') or record.get('class_id')
             if not obj:
@@ -460,7 +512,8 @@ class SaveData:
                         'battery': members.get('II:B', 0),
                         'max_battery': members.get('II:MB', 0),
                     }
-        
+
+        self._derived_cache['item_instances'] = instances
         return instances
     
     def get_inventory_items(self) -> list:
@@ -469,6 +522,9 @@ class SaveData:
         
         These are stored in LIDP (List Item Data Provider) records.
         """
+        if 'inventory_items' in self._derived_cache:
+            return self._derived_cache['inventory_items']
+
         items = []
         item_instances = self.get_item_instances()
         
@@ -511,9 +567,10 @@ class SaveData:
                         'battery': instance.get('battery', 0),
                         'id': obj_id
                     })
-        
+
+        self._derived_cache['inventory_items'] = items
         return items
-    
+
     def get_crafted_items(self) -> list:
         """
         Get crafted/unique items (items with display names like 'Pneumatic Bladed Tungsten Steel Gloves').
@@ -521,6 +578,9 @@ class SaveData:
         These are full item objects with I:N (name) field.
         Includes instance data (durability, battery) when available.
         """
+        if 'crafted_items' in self._derived_cache:
+            return self._derived_cache['crafted_items']
+
         items = self.get_all_items()
         instances = self.get_item_instances()
         
@@ -552,7 +612,8 @@ class SaveData:
                                 item['current_durability'] = instance.get('durability', 0)
                                 item['current_battery'] = instance.get('battery', 0)
                                 break
-        
+
+        self._derived_cache['crafted_items'] = items
         return items
 
 
@@ -669,8 +730,18 @@ class SaveEditor:
         return self._json_data
     
     def get_save_data(self) -> SaveData:
-        """Get a SaveData wrapper for reading values."""
+        """
+        Get a SaveData view of the editor's in-memory JSON.
+
+        Reflects any edits made through this editor without flushing to
+        disk or re-running UFE, so it is much cheaper than re-exporting
+        the patched save. Use the export path instead when the on-disk
+        format itself is under test.
+        """
         return SaveData(self._json_data)
+
+    # Backwards-compatible alias used by the cross-platform tests.
+    current_save_data = get_save_data
     
     def _find_skill_record(self, skill_index: int) -> Optional[dict]:
         """Find the skill record at the given index."""
@@ -122,11 +122,11 @@ def display_character_data(save_path: Path):
         print("SKILLS")
         print("-" * 40)
         
-        # Build skill lookup
-        skill_lookup = {}
-        for i, skill in enumerate(skills):
-            name = skill_names[i] if i < len(skill_names) else f"Unknown_{i}"
-            skill_lookup[name] = skill
+        # Build skill lookup; zip stops at the shorter list, so any
+        # surplus entries get placeholder names afterwards
+        skill_lookup = dict(zip(skill_names, skills))
+        for i in range(len(skill_names), len(skills)):
+            skill_lookup[f"Unknown_{i}"] = skills[i]
         
         for category, skill_list in SKILL_CATEGORIES.items():
             category_skills = [(name, skill_lookup.get(name)) for name in skill_list if name in skill_lookup]
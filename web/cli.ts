@@ -10,6 +10,7 @@
  */
 
 import * as fs from 'fs';
+import * as readline from 'readline';
 import { parseRawData, patchSkills, patchAttributes, createSaveFile } from './src/parser/index';
 
 interface PatchOperation {
@@ -19,6 +20,57 @@ interface PatchOperation {
   effective?: number;
 }
 
+function parseSaveToJson(inputPath: string): object {
+  const data = new Uint8Array(fs.readFileSync(inputPath));
+  const { saveData } = parseRawData(data);
+  // JSON-serializable version (without Map and raw records)
+  return {
+    character: saveData.character,
+    attributes: saveData.attributes,
+    skills: saveData.skills,
+    feats: saveData.feats,
+    equipment: saveData.equipment,
+    inventory: saveData.inventory,
+    currency: saveData.currency,
+  };
+}
+
+function applyPatches(inputPath: string, outputPath: string, operations: PatchOperation[]) {
+  const data = new Uint8Array(fs.readFileSync(inputPath));
+  const { saveData, header, rawData } = parseRawData(data);
+
+  let patchedData = rawData;
+
+  const skillChanges = new Map<number, { base?: number; effective?: number }>();
+  const attrChanges = new Map<number, { base?: number; effective?: number }>();
+
+  for (const op of operations) {
+    if (op.type === 'skill') {
+      skillChanges.set(op.index, {
+        base: op.base,
+        effective: op.effective ?? op.base  // Default effective to base if not specified
+      });
+    } else {
+      attrChanges.set(op.index, {
+        base: op.base,
+        effective: op.effective ?? op.base
+      });
+    }
+  }
+
+  if (skillChanges.size > 0) {
+    patchedData = patchSkills(patchedData, saveData.skills, skillChanges);
+  }
+  if (attrChanges.size > 0) {
+    patchedData = patchAttributes(patchedData, saveData.attributes, attrChanges);
+  }
+
+  const outputData = createSaveFile(patchedData, header);
+  fs.writeFileSync(outputPath, outputData);
+
+  return saveData;
+}
+
 function printUsage(): void {
   console.log(`
 Underrail Save Editor CLI
@@ -30,6 +82,13 @@ Usage:
   npx ts-node cli.ts patch <input.dat> <output.dat> [options]
     Patch a save file with changes
 
+  npx ts-node cli.ts patch-and-dump <input.dat> <output.dat> [options] --dump-json <out.json>
+    Patch a save file and write the parsed result as JSON in one run
+
+  npx ts-node cli.ts server
+    Read JSON commands from stdin, one per line, and answer on stdout
+    (used by the test suite to avoid per-call startup cost)
+
 Options for patch:
   --skill <index> <base> [effective]   Set skill value
   --attr <index> <base> [effective]    Set attribute value
@@ -57,22 +116,11 @@ function parseCommand(args: string[]): void {
     process.exit(1);
   }
 
-  const data = new Uint8Array(fs.readFileSync(inputPath));
-  const { saveData } = parseRawData(data);
-
   if (jsonOutput) {
-    // Output JSON-serializable version (without Map and raw records)
-    const output = {
-      character: saveData.character,
-      attributes: saveData.attributes,
-      skills: saveData.skills,
-      feats: saveData.feats,
-      equipment: saveData.equipment,
-      inventory: saveData.inventory,
-      currency: saveData.currency,
-    };
-    console.log(JSON.stringify(output, null, 2));
+    console.log(JSON.stringify(parseSaveToJson(inputPath), null, 2));
   } else {
+    const data = new Uint8Array(fs.readFileSync(inputPath));
+    const { saveData } = parseRawData(data);
     // Print summary
     console.log(`Character: ${saveData.character.name}`);
     console.log(`Level: ${saveData.character.level}`);
@@ -92,23 +140,7 @@ function parseCommand(args: string[]): void {
   }
 }
 
-function patchCommand(args: string[]): void {
-  if (args.length < 2) {
-    console.error('Error: Missing input or output file');
-    printUsage();
-    process.exit(1);
-  }
-
-  const inputPath = args[0];
-  const outputPath = args[1];
-  const patchArgs = args.slice(2);
-
-  if (!fs.existsSync(inputPath)) {
-    console.error(`Error: File not found: ${inputPath}`);
-    process.exit(1);
-  }
-
-  // Parse patch operations
+function parsePatchOps(patchArgs: string[]): PatchOperation[] {
   const operations: PatchOperation[] = [];
   let i = 0;
   while (i < patchArgs.length) {
@@ -118,7 +150,7 @@ function patchCommand(args: string[]): void {
       const index = parseInt(patchArgs[i + 1], 10);
       const base = parseInt(patchArgs[i + 2], 10);
       let effective: number | undefined;
-      
+
       // Check if next arg is another option or effective value
       if (patchArgs[i + 3] && !patchArgs[i + 3].startsWith('--')) {
         effective = parseInt(patchArgs[i + 3], 10);
@@ -146,40 +178,29 @@ function patchCommand(args: string[]): void {
     process.exit(1);
   }
 
-  // Read and parse input file
-  const data = new Uint8Array(fs.readFileSync(inputPath));
-  const { saveData, header, rawData } = parseRawData(data);
+  return operations;
+}
 
-  // Apply patches
-  let patchedData = rawData;
+function patchCommand(args: string[]): void {
+  if (args.length < 2) {
+    console.error('Error: Missing input or output file');
+    printUsage();
+    process.exit(1);
+  }
 
-  const skillChanges = new Map<number, { base?: number; effective?: number }>();
-  const attrChanges = new Map<number, { base?: number; effective?: number }>();
+  const inputPath = args[0];
+  const outputPath = args[1];
+  const patchArgs = args.slice(2);
 
-  for (const op of operations) {
-    if (op.type === 'skill') {
-      skillChanges.set(op.index, { 
-        base: op.base, 
-        effective: op.effective ?? op.base  // Default effective to base if not specified
-      });
-    } else {
-      attrChanges.set(op.index, { 
-        base: op.base, 
-        effective: op.effective ?? op.base 
-      });
-    }
+  if (!fs.existsSync(inputPath)) {
+    console.error(`Error: File not found: ${inputPath}`);
+    process.exit(1);
   }
 
-  if (skillChanges.size > 0) {
-    patchedData = patchSkills(patchedData, saveData.skills, skillChanges);
-  }
-  if (attrChanges.size > 0) {
-    patchedData = patchAttributes(patchedData, saveData.attributes, attrChanges);
-  }
+  const operations = parsePatchOps(patchArgs);
 
-  // Create output file
-  const outputData = createSaveFile(patchedData, header);
-  fs.writeFileSync(outputPath, outputData);
+  // Read, patch, and write the save file
+  const saveData = applyPatches(inputPath, outputPath, operations);
 
   console.log(`Patched save written to: ${outputPath}`);
   console.log(`Applied ${operations.length} change(s)`);
@@ -196,6 +217,106 @@ function patchCommand(args: string[]): void {
   }
 }
 
+function patchAndDumpCommand(args: string[]): void {
+  // Fused patch + parse: apply the edits and dump the parsed result of the
+  // patched file as JSON in a single process, instead of a patch run
+  // followed by a separate parse run.
+  const dumpIdx = args.indexOf('--dump-json');
+  if (dumpIdx === -1 || !args[dumpIdx + 1]) {
+    console.error('Error: patch-and-dump requires --dump-json <path>');
+    printUsage();
+    process.exit(1);
+  }
+  const dumpPath = args[dumpIdx + 1];
+  const patchArgsOnly = args.slice(0, dumpIdx).concat(args.slice(dumpIdx + 2));
+
+  if (patchArgsOnly.length < 2) {
+    console.error('Error: Missing input or output file');
+    printUsage();
+    process.exit(1);
+  }
+
+  const inputPath = patchArgsOnly[0];
+  const outputPath = patchArgsOnly[1];
+
+  if (!fs.existsSync(inputPath)) {
+    console.error(`Error: File not found: ${inputPath}`);
+    process.exit(1);
+  }
+
+  const operations = parsePatchOps(patchArgsOnly.slice(2));
+  applyPatches(inputPath, outputPath, operations);
+  fs.writeFileSync(dumpPath, JSON.stringify(parseSaveToJson(outputPath), null, 2));
+
+  console.log(`Patched save written to: ${outputPath}`);
+  console.log(`Parsed JSON written to: ${dumpPath}`);
+}
+
+interface ServerRequest {
+  cmd: 'parse' | 'patch' | 'ping' | 'quit';
+  path?: string;
+  input?: string;
+  output?: string;
+  ops?: PatchOperation[];
+  dump?: boolean;
+}
+
+function serverCommand(): void {
+  // Long-lived mode for automated testing: read one JSON request per stdin
+  // line, write one JSON response per stdout line. Amortizes npx/tsx
+  // startup over a whole test run instead of paying it per invocation.
+  const rl = readline.createInterface({ input: process.stdin, terminal: false });
+
+  rl.on('line', (line: string) => {
+    const trimmed = line.trim();
+    if (!trimmed) {
+      return;
+    }
+
+    try {
+      const request: ServerRequest = JSON.parse(trimmed);
+      switch (request.cmd) {
+        case 'ping':
+          console.log(JSON.stringify({ ok: true }));
+          break;
+        case 'parse':
+          if (!request.path || !fs.existsSync(request.path)) {
+            throw new Error(`File not found: ${request.path}`);
+          }
+          console.log(JSON.stringify({ ok: true, data: parseSaveToJson(request.path) }));
+          break;
+        case 'patch':
+          if (!request.input || !fs.existsSync(request.input)) {
+            throw new Error(`File not found: ${request.input}`);
+          }
+          if (!request.output || !request.ops || request.ops.length === 0) {
+            throw new Error('patch requires output and non-empty ops');
+          }
+          applyPatches(request.input, request.output, request.ops);
+          if (request.dump) {
+            console.log(JSON.stringify({
+              ok: true,
+              applied: request.ops.length,
+              data: parseSaveToJson(request.output),
+            }));
+          } else {
+            console.log(JSON.stringify({ ok: true, applied: request.ops.length }));
+          }
+          break;
+        case 'quit':
+          console.log(JSON.stringify({ ok: true }));
+          rl.close();
+          process.exit(0);
+          break;
+        default:
+          throw new Error(`Unknown cmd: ${(request as ServerRequest).cmd}`);
+      }
+    } catch (err) {
+      console.log(JSON.stringify({ ok: false, error: String(err) }));
+    }
+  });
+}
+
 // Main entry point
 const args = process.argv.slice(2);
 
@@ -214,6 +335,13 @@ switch (command) {
   case 'patch':
     patchCommand(commandArgs);
     break;
+  case 'patch-and-dump':
+    patchAndDumpCommand(commandArgs);
+    break;
+  case 'server':
+  case '--server':
+    serverCommand();
+    break;
   case 'help':
   case '--help':
   case '-h':